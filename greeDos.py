@@ -40,22 +40,35 @@ Usage:
 
 import argparse
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 import threading
 import time
 import sqlite3
 import random
 import sys
 from datetime import datetime
-from collections import deque
+from collections import deque, namedtuple
+from itertools import islice
 
+import numpy as np
 
-from rich.console import Console
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from rich.console import Console, Group
 from rich.table import Table
 from rich.live import Live
 from rich.panel import Panel
+from rich.markup import escape
 
 
 console = Console()
+_rng = np.random.default_rng()
 
 
 GreeDos_LOGO = r"""
@@ -69,25 +82,123 @@ GreeDos_LOGO = r"""
 
 
 ALERT_THRESHOLD = 100  
+PACKET_BATCH_SIZE = 1
+ANOMALY_RATE = 0.05
+MAX_ALERTS = 1000
+ALERT_CHECK_INTERVAL = 2  # seconds
+DASHBOARD_MIN_INTERVAL = 0.5  # seconds
+
+
+DB_PATH = "osint_tool.db"
+DB_BATCH_SIZE = 500
+DB_MAX_PENDING = 50_000
+
+_tls = threading.local()
+_log_queue = queue.Queue()
+_listener = None
+
+db_logger = logging.getLogger("greedos")
+db_logger.setLevel(logging.INFO)
+db_logger.propagate = False
+
+
+def _get_conn():
+    
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA busy_timeout=5000")
+        _tls.conn = conn
+    return conn
+
+
+class SQLiteHandler(logging.Handler):
+    
+    def __init__(self, source: queue.Queue):
+        super().__init__()
+        self.source = source
+        self._rows = []
+        self._last_record = None
+        self._failing = False
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            rows = getattr(record, "rows", None)
+            if rows is None:
+                self._rows.append((getattr(record, "event_type", record.levelname), record.getMessage()))
+            else:
+                self._rows.extend(rows)
+        except Exception:
+            self.handleError(record)
+            return
+        self._last_record = record
+        # Commit once the backlog is drained, so bursts share a single transaction.
+        if len(self._rows) >= DB_BATCH_SIZE or self.source.empty():
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        conn = _get_conn()
+        try:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT INTO events (event_type, details) VALUES (?, ?)", rows)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            # Keep the failed rows for the next attempt, dropping the oldest past the cap.
+            self._rows[:0] = rows
+            del self._rows[:-DB_MAX_PENDING]
+            # Only the first failure of a streak is reported; retries stay quiet until a write succeeds.
+            if not self._failing:
+                self._failing = True
+                self.handleError(self._last_record)
+        else:
+            self._failing = False
+
+    def close(self):
+        self.flush()
+        super().close()
 
 
 def init_database():
     
-    conn = sqlite3.connect("osint_tool.db")
-    cur = conn.cursor()
-    cur.execute("""
-        
+    global _listener
+    if _listener is not None:
+        return
+    conn = _get_conn()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+            event_type TEXT,
+            details TEXT
+        )
     """)
-    conn.commit()
-    conn.close()
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(event_type, timestamp)")
+    db_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _listener = logging.handlers.QueueListener(_log_queue, SQLiteHandler(_log_queue))
+    _listener.start()
+    atexit.register(_shutdown_database)
+
+def _shutdown_database():
+    
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
 
 def log_event_to_db(event_type: str, details: str):
     
-    conn = sqlite3.connect("osint_tool.db")
-    cur = conn.cursor()
-    cur.execute("INSERT INTO events (event_type, details) VALUES (?, ?)", (event_type, details))
-    conn.commit()
-    conn.close()
+    db_logger.info("%s", details, extra={"event_type": event_type})
+
+def log_events_to_db(rows):
+    
+    db_logger.info("%d events", len(rows), extra={"rows": rows})
 
 
 class AttackSimulator:
@@ -97,67 +208,121 @@ class AttackSimulator:
         self.threads = threads
         self.duration = duration  # seconds
         self.running = False
-        self.requests_sent = 0
-        self.lock = threading.Lock()
+        self._counts = [0] * threads
+
+    @property
+    def requests_sent(self) -> int:
+        return sum(self._counts)
 
-    def simulate_http_flood(self):
+    async def simulate_http_flood(self, slot: int):
         
-        end_time = time.time() + self.duration
-        while time.time() < end_time and self.running:
-            time.sleep(0.05 + random.uniform(0, 0.1))  
-            with self.lock:
-                self.requests_sent += 1
+        counts = self._counts
+        while self.running:
+            await asyncio.sleep(0.05 + random.uniform(0, 0.1))  
+            counts[slot] += 1
            
-        log_event_to_db("SIMULATION", "One simulation thread has finished.")
+        log_event_to_db("SIMULATION", "One simulation worker has finished.")
 
-    def start(self):
+    async def start(self):
        
         self.running = True
-        thread_list = []
-        for i in range(self.threads):
-            t = threading.Thread(target=self.simulate_http_flood, name=f"FloodThread-{i+1}")
-            t.start()
-            thread_list.append(t)
-        for t in thread_list:
-            t.join()
-        self.running = False
+        deadline = asyncio.get_running_loop().call_later(self.duration, self.stop)
+        try:
+            await asyncio.gather(*(self.simulate_http_flood(i) for i in range(self.threads)))
+        finally:
+            deadline.cancel()
+            self.running = False
 
     def stop(self):
         self.running = False
 
 
+Event = namedtuple("Event", "ts_ns event_type details rendered")
+
+
 class ForensicAnalyzer:
    
     def __init__(self):
         self.event_queue = deque(maxlen=50)
+        self.version = 0
+        self.notify = None
+        self._ts_cache = (None, "")
+
+    def _format_ts(self, ts_ns: int) -> str:
+        # strftime only runs once per wall-clock second; events within it reuse the string.
+        sec = ts_ns // 1_000_000_000
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S"))
+        return self._ts_cache[1]
 
     def log_event(self, event_type: str, details: str):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        event = {"timestamp": timestamp, "event_type": event_type, "details": details}
-        self.event_queue.append(event)
+        ts_ns = time.time_ns()
+        self.event_queue.append(
+            Event(ts_ns, event_type, details, f"{self._format_ts(ts_ns)} | {event_type}: {details}")
+        )
+        self.version += 1
+        notify = self.notify
+        if notify is not None:
+            notify()
         log_event_to_db(event_type, details)
 
+    def log_events(self, event_type: str, details_list):
+        ts_ns = time.time_ns()
+        timestamp = self._format_ts(ts_ns)
+        for details in details_list[-self.event_queue.maxlen:]:
+            self.event_queue.append(Event(ts_ns, event_type, details, f"{timestamp} | {event_type}: {details}"))
+        self.version += 1
+        notify = self.notify
+        if notify is not None:
+            notify()
+        log_events_to_db([(event_type, details) for details in details_list])
+
     def get_recent_events(self, count: int = 10):
-        return list(self.event_queue)[-count:]
+        return list(islice(reversed(self.event_queue), count))[::-1]
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def scan_anomalies(r: np.ndarray, thr: float, out: np.ndarray) -> int:
+        
+        n = 0
+        for i in range(r.shape[0]):
+            if r[i] < thr:
+                out[n] = i
+                n += 1
+        return n
+else:
+    def scan_anomalies(r: np.ndarray, thr: float, out: np.ndarray) -> int:
+        
+        idx = np.flatnonzero(r < thr)
+        out[:idx.size] = idx
+        return idx.size
 
 
 class ProtocolAnalyzer:
    
-    def __init__(self, analyzer: ForensicAnalyzer):
+    def __init__(self, analyzer: ForensicAnalyzer, batch_size: int = PACKET_BATCH_SIZE):
         self.analyzer = analyzer
+        self.batch_size = batch_size
+        self._anomaly_idx = np.empty(batch_size, dtype=np.int64)
 
-    def analyze_packet(self, packet):
+    def analyze_packet_batch(self, packet_ids: np.ndarray):
         
-        if random.random() < 0.05:
-            self.analyzer.log_event("PROTOCOL_ALERT", f"Suspicious packet detected: {packet}")
+        n = scan_anomalies(_rng.random(packet_ids.shape[0]), ANOMALY_RATE, self._anomaly_idx)
+        if n:
+            anomalies = self._anomaly_idx[:n]
+            self.analyzer.log_events(
+                "PROTOCOL_ALERT",
+                [f"Suspicious packet detected: Packet-{pid}" for pid in packet_ids[anomalies].tolist()],
+            )
 
     def start_sniffing(self):
        
         while True:
-            time.sleep(random.uniform(0.1, 0.5))
-            dummy_packet = f"Packet-{random.randint(1,1000)}"
-            self.analyzer.log_event("PACKET", f"Captured {dummy_packet}")
-            self.analyze_packet(dummy_packet)
+            time.sleep(_rng.uniform(0.1, 0.5))
+            packet_ids = _rng.integers(1, 1001, self.batch_size)
+            self.analyzer.log_events("PACKET", [f"Captured Packet-{pid}" for pid in packet_ids.tolist()])
+            self.analyze_packet_batch(packet_ids)
 
 
 class AlertDetector:
@@ -165,14 +330,17 @@ class AlertDetector:
     def __init__(self, simulator: AttackSimulator, analyzer: ForensicAnalyzer):
         self.simulator = simulator
         self.analyzer = analyzer
-        self.alerts = []
+        self._alert_set: set[str] = set()
+        self.alerts: deque[str] = deque(maxlen=MAX_ALERTS)
 
     def check_for_alerts(self):
-        with self.simulator.lock:
-            req_count = self.simulator.requests_sent
+        req_count = self.simulator.requests_sent
         if req_count > ALERT_THRESHOLD:
             alert_msg = f"High traffic alert: {req_count} requests sent!"
-            if alert_msg not in self.alerts:
+            if alert_msg not in self._alert_set:
+                if len(self.alerts) == self.alerts.maxlen:
+                    self._alert_set.discard(self.alerts[0])
+                self._alert_set.add(alert_msg)
                 self.alerts.append(alert_msg)
                 self.analyzer.log_event("TRAFFIC_ALERT", alert_msg)
         return self.alerts
@@ -184,36 +352,70 @@ class Dashboard:
         self.simulator = simulator
         self.analyzer = analyzer
         self.detector = detector
+        self._rendered_state = None
+        self._table = Table(title="GreeDoS Dashboard")
+        self._table.add_column("Metric", style="cyan", no_wrap=True)
+        self._table.add_column("Value", style="magenta")
+        self._table.add_row("Target", self.simulator.target)
+        self._table.add_row("Threads", str(self.simulator.threads))
+        self._table.add_row("Duration (sec)", str(self.simulator.duration))
+        self._req_row_idx = self._table.row_count
+        self._table.add_row("Requests Sent", "0")
 
     def render_dashboard(self):
       
-        table = Table(title="GreeDoS Dashboard")
-        table.add_column("Metric", style="cyan", no_wrap=True)
-        table.add_column("Value", style="magenta")
-        table.add_row("Target", self.simulator.target)
-        table.add_row("Threads", str(self.simulator.threads))
-        table.add_row("Duration (sec)", str(self.simulator.duration))
-        with self.simulator.lock:
-            table.add_row("Requests Sent", str(self.simulator.requests_sent))
+        table = self._table
+        table.columns[1]._cells[self._req_row_idx] = str(self.simulator.requests_sent)
   
         recent_events = self.analyzer.get_recent_events(5)
-        logs_str = "\n".join([f"{ev['timestamp']} | {ev['event_type']}: {ev['details']}" for ev in recent_events])
+        logs_str = "\n".join(ev.rendered for ev in recent_events)
         log_panel = Panel(logs_str if logs_str else "No events", title="Forensic Log", border_style="red")
        
-        alerts = self.detector.alerts[-5:]
+        alerts = list(islice(reversed(self.detector.alerts), 5))[::-1]
         alert_panel = Panel("\n".join(alerts) if alerts else "No alerts", title="Alerts", border_style="yellow")
         return table, log_panel, alert_panel
 
     async def display(self):
-        with Live(refresh_per_second=2, console=console) as live:
-            while True:
-                self.detector.check_for_alerts()
-                table, log_panel, alert_panel = self.render_dashboard()
-                combined = Panel.fit(table, title="Main Dashboard")
-                live.update(combined)
-                console.print(log_panel)
-                console.print(alert_panel)
-                await asyncio.sleep(2)
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        wake = asyncio.Event()
+        wake.set()
+
+        def notify():
+            if threading.get_ident() == loop_thread:
+                wake.set()
+            else:
+                loop.call_soon_threadsafe(wake.set)
+
+        self.analyzer.notify = notify
+        try:
+            with Live(console=console, auto_refresh=False) as live:
+                next_check = loop.time()
+                while True:
+                    try:
+                        await asyncio.wait_for(wake.wait(), timeout=max(0.0, next_check - loop.time()))
+                    except asyncio.TimeoutError:
+                        pass
+                    if loop.time() >= next_check:
+                        next_check = loop.time() + ALERT_CHECK_INTERVAL
+                        self.detector.check_for_alerts()
+                    # Cleared after the check so the detector's own alert event does not wake the next cycle.
+                    wake.clear()
+                    state = (self.analyzer.version, self.simulator.requests_sent)
+                    if state != self._rendered_state:
+                        self._rendered_state = state
+                        table, log_panel, alert_panel = self.render_dashboard()
+                        combined = Panel.fit(table, title="Main Dashboard")
+                        live.update(Group(combined, log_panel, alert_panel), refresh=True)
+                    await asyncio.sleep(DASHBOARD_MIN_INTERVAL)
+        finally:
+            self.analyzer.notify = None
+
+
+def _report_task_error(task: asyncio.Task):
+    
+    if not task.cancelled() and task.exception() is not None:
+        console.log(f"[bold red]{task.get_name()} failed: {escape(repr(task.exception()))}[/bold red]")
 
 
 async def main(args):
@@ -228,18 +430,21 @@ async def main(args):
     simulator = AttackSimulator(args.target, args.threads, args.duration)
     detector = AlertDetector(simulator, analyzer)
     dashboard = Dashboard(simulator, analyzer, detector)
-    protocol_analyzer = ProtocolAnalyzer(analyzer)
+    protocol_analyzer = ProtocolAnalyzer(analyzer, args.packet_batch)
 
    
-    sim_thread = threading.Thread(target=simulator.start, name="AttackSimulatorThread")
-    sim_thread.start()
+    sim_task = asyncio.create_task(simulator.start(), name="AttackSimulator")
+    sim_task.add_done_callback(_report_task_error)
 
     
     proto_thread = threading.Thread(target=protocol_analyzer.start_sniffing, name="ProtocolAnalyzerThread", daemon=True)
     proto_thread.start()
 
     
-    await dashboard.display()
+    try:
+        await dashboard.display()
+    finally:
+        sim_task.cancel()
 
 
 if __name__ == '__main__':
@@ -251,7 +456,11 @@ if __name__ == '__main__':
                         help='Number of threads for attack simulation')
     parser.add_argument('--duration', type=int, default=30,
                         help='Duration of the simulation in seconds')
+    parser.add_argument('--packet-batch', type=int, default=PACKET_BATCH_SIZE,
+                        help='Dummy packets captured (and stored) per sniffer tick')
     args = parser.parse_args()
+    if args.packet_batch < 1:
+        parser.error("--packet-batch must be at least 1")
 
     try:
         asyncio.run(main(args))